@@ -5,27 +5,58 @@
 ##########################################
 
 import math
+import bisect
 import itertools
 import random
 import csv
 import os
+from functools import lru_cache
+
+import numpy as np
 
 # Attempt to import treys for card evaluations (optional if you need it)
 try:
-    from treys import Card, Evaluator, Deck
+    from treys import Card, Evaluator
+    from treys.lookup import LookupTable
 except ImportError:
     print("WARNING: 'treys' library not found. If you need card evaluation, install it via: pip install treys")
     Card = None
     Evaluator = None
-    Deck = None
+    LookupTable = None
 
 ########################
 # Basic Poker Constants
 ########################
 RANKS = "AKQJT98765432"
+RANK_ORDER = {r: i for i, r in enumerate(RANKS)}  # Rank -> index in RANKS (0 = Ace), O(1) instead of RANKS.index
 TOTAL_COMBOS = 1326
 SUITS_TREYS = "shdc"  # For treys usage if needed
 
+# treys card ints by rank and suit, built once so hot loops never re-parse card strings
+_CARD_INT = {r: {s: Card.new(r + s) for s in SUITS_TREYS} for r in RANKS} if Card else {}
+# All 52 treys card ints, built once so the equity sim never has to construct a Deck()
+ALL_52 = tuple(_CARD_INT[r][s] for r in RANKS for s in SUITS_TREYS) if Card else ()
+# One bit per card (52 bits), so sets of cards become ints that combine with | and &
+_CARD_BIT = {card: 1 << i for i, card in enumerate(ALL_52)}
+# Suit assignments for the specific combos of a pair / offsuit hand
+_PAIR_SUITS = tuple(itertools.combinations(SUITS_TREYS, 2))
+_OFFSUIT_SUITS = tuple((s1, s2) for s1 in SUITS_TREYS for s2 in SUITS_TREYS if s1 != s2)
+
+def _gen_all_hands():
+    for i, rank1 in enumerate(RANKS):
+        for rank2 in RANKS[i:]:
+            if rank1 == rank2:  # Pocket pair
+                yield rank1 + rank2
+            else:
+                yield f"{rank1}{rank2}s"  # Suited
+                yield f"{rank1}{rank2}o"  # Offsuit
+
+# All 169 starting hands, built once at import
+ALL_HANDS = tuple(_gen_all_hands())
+# Combo count per hand; reversed-rank spellings ("KAs") are keyed too since they always counted
+HAND_COMBOS = {h: (6 if len(h) == 2 else 4 if h[2] == 's' else 12) for h in ALL_HANDS}
+HAND_COMBOS.update({h[1] + h[0] + h[2]: HAND_COMBOS[h] for h in ALL_HANDS if len(h) == 3})
+
 # This is your custom push/fold hand ordering that prioritizes pairs first, 
 # then suited Aces, etc. It's exactly what you had in your code.
 SIMPLIFIED_HAND_RANKING = [
@@ -71,6 +102,10 @@ SIMPLIFIED_HAND_RANKING = [
 ########################
 # Utility: get combos
 ########################
+def get_all_hands():
+    """Returns the 169 canonical starting hands (pairs, then suited/offsuit per rank pair)."""
+    return ALL_HANDS
+
 def get_hand_combos(hand_str):
     """
     Returns how many combos a canonical hand string has:
@@ -80,68 +115,61 @@ def get_hand_combos(hand_str):
     """
     if not isinstance(hand_str, str):
         return 0
-    if len(hand_str) == 2:
-        # Pair
-        if hand_str[0] in RANKS and hand_str[1] == hand_str[0]:
-            return 6
-        else:
-            return 0
-    elif len(hand_str) == 3:
-        if hand_str[0] in RANKS and hand_str[1] in RANKS and hand_str[0] != hand_str[1]:
-            if hand_str[2] == 's':
-                return 4
-            elif hand_str[2] == 'o':
-                return 12
-    return 0
+    return HAND_COMBOS.get(hand_str, 0)
+
+# Position of every HAND_COMBOS key in _COMBO_VEC; the trailing 0 slot (index -1)
+# absorbs strings that aren't hands so they add no combos.
+_HAND_INDEX = {h: i for i, h in enumerate(HAND_COMBOS)}
+_COMBO_VEC = np.array([*HAND_COMBOS.values(), 0], dtype=np.int16)
 
 def calculate_range_percentage(hand_range):
     """
     Calculates what percentage of total combos a range represents.
-    hand_range: set or list of canonical hand strings (e.g. ["AA", "AKs"])
+    hand_range: set, list or tuple of canonical hand strings (e.g. ["AA", "AKs"])
     Returns float percentage (0-100)
     """
-    if not isinstance(hand_range, (list, set)) or not hand_range:
+    if not isinstance(hand_range, (list, tuple, set, frozenset)) or not hand_range:
         return 0.0
-    total_combos = sum(get_hand_combos(h) for h in hand_range)
+    idx = np.fromiter((_HAND_INDEX.get(h, -1) for h in hand_range), dtype=np.intp, count=len(hand_range))
+    total_combos = int(_COMBO_VEC[idx].sum())
     return (total_combos / TOTAL_COMBOS) * 100.0
 
 ########################
 # Utility: top X% 
 ########################
+# Combos accumulated *before* each hand of SIMPLIFIED_HAND_RANKING.
+# Strictly increasing, so the top-X% cut is a single bisect over this table.
+_RANKING_COMBOS_BEFORE = tuple(
+    itertools.accumulate((get_hand_combos(h) for h in SIMPLIFIED_HAND_RANKING[:-1]), initial=0)
+)
+
+@lru_cache(maxsize=256)
 def get_top_hands_by_percentage(percentage):
     """
-    Returns a list of canonical hands that cover top `percentage` of combos
-    based on SIMPLIFIED_HAND_RANKING. We sum combos until we reach 
-    (TOTAL_COMBOS * percentage/100). 
+    Returns a tuple of canonical hands that cover top `percentage` of combos
+    based on SIMPLIFIED_HAND_RANKING. We keep adding hands while the running
+    combo count is below (TOTAL_COMBOS * percentage/100).
+    Results are cached, so the returned tuple is shared between callers.
     """
     if not isinstance(percentage, (int,float)) or percentage <= 0:
-        return []
+        return ()
     if percentage >= 100:
         # entire ranking
-        return list(SIMPLIFIED_HAND_RANKING)
+        return tuple(SIMPLIFIED_HAND_RANKING)
 
     combos_needed = TOTAL_COMBOS * (percentage / 100.0)
-    selected_hands = []
-    running_combos = 0
-
-    for hand in SIMPLIFIED_HAND_RANKING:
-        ccount = get_hand_combos(hand)
-        if ccount == 0:
-            continue
-        if running_combos < combos_needed:
-            selected_hands.append(hand)
-            running_combos += ccount
-        else:
-            break
-
-    return selected_hands
+    cutoff = bisect.bisect_left(_RANKING_COMBOS_BEFORE, combos_needed)
+    return tuple(SIMPLIFIED_HAND_RANKING[:cutoff])
 
 ########################
 # Parse CSV
 ########################
+# Drops '%' and turns decimal commas into points in one pass: "55,7%" -> "55.7"
+_CSV_NUMBER_TRANS = str.maketrans({'%': None, ',': '.'})
+
 def parse_push_fold_csv(csv_data):
     """
-    Parses lines from 'push ranges.csv' into a dictionary:
+    Parses 'push ranges.csv' (the whole text, or an open file / iterable of lines) into a dictionary:
       { stack: { 'SB': float, 'B': float, 'CO': float, ... } }
     The CSV must have a column 'Stack' and columns for 'SB','B','CO','HJ','LJ','UTG+3','UTG+2','UTG+1','UTG'.
     Example row:
@@ -150,7 +178,8 @@ def parse_push_fold_csv(csv_data):
     """
     ranges = {}
     try:
-        reader = csv.DictReader(csv_data.splitlines())
+        lines = csv_data.splitlines() if isinstance(csv_data, str) else csv_data
+        reader = csv.DictReader(lines)
         headers = reader.fieldnames
         if not headers or 'Stack' not in headers:
             print("ERROR: CSV missing 'Stack' column header.")
@@ -165,7 +194,7 @@ def parse_push_fold_csv(csv_data):
                 # skip empty stack line
                 continue
             try:
-                stack_val = float(stack_str)
+                stack_val = float(stack_str.translate(_CSV_NUMBER_TRANS))
             except ValueError:
                 print(f"Skipping row with invalid stack '{stack_str}'")
                 continue
@@ -174,7 +203,7 @@ def parse_push_fold_csv(csv_data):
                 val_str = row.get(col,'').strip()
                 if val_str:
                     try:
-                        subdict[col] = float(val_str)
+                        subdict[col] = float(val_str.translate(_CSV_NUMBER_TRANS))
                     except ValueError:
                         print(f"WARNING: Invalid float at stack={stack_val}, col={col}, val={val_str}")
             ranges[stack_val] = subdict
@@ -191,28 +220,83 @@ def parse_push_fold_csv(csv_data):
 ########################
 # Global dictionary: 
 # { stack_size: { pos: percentage } }
+# Filled on first use by _load_push_fold_ranges()
 ########################
 PUSH_FOLD_RANGES = {}
+_STACK_KEYS, _CLOSEST_STACK_BY_BB, _ADVICE_TABLE = [], {}, {}
+_push_fold_loaded = False
 
 ########################
-# Attempt to load "push ranges.csv" at module load
+# Precomputed advice tables
 ########################
-try:
-    module_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_file_path = os.path.join(module_dir, "push ranges.csv")
-    if os.path.isfile(csv_file_path):
-        with open(csv_file_path, 'r', encoding='utf-8') as f:
-            csv_data = f.read()
-        loaded = parse_push_fold_csv(csv_data)
-        if loaded:
-            PUSH_FOLD_RANGES = loaded
-            print("INFO: push_fold_data loaded from 'push ranges.csv' at module load.")
+def _closest_stack(stack_keys, stack_bb):
+    """Nearest entry of the sorted stack_keys via binary search (ties go to the smaller stack)."""
+    idx = bisect.bisect_left(stack_keys, stack_bb)
+    if idx == 0:
+        return stack_keys[0]
+    if idx == len(stack_keys):
+        return stack_keys[-1]
+    below, above = stack_keys[idx - 1], stack_keys[idx]
+    return below if stack_bb - below <= above - stack_bb else above
+
+def _build_push_fold_tables(ranges):
+    """
+    Partially evaluates get_push_fold_advice over the parsed CSV.
+    Returns (stack_keys, closest_stack_by_bb, advice_table):
+      stack_keys          -> sorted CSV stack sizes
+      closest_stack_by_bb -> { whole_bb: closest CSV stack } for 1..max stack
+      advice_table        -> { (csv_stack, pos): (advice_str, range_tuple, percentage, tips_str) }
+    """
+    stack_keys = sorted(ranges)
+    closest_stack_by_bb = {}
+    if stack_keys:
+        for bb in range(1, int(stack_keys[-1]) + 1):
+            closest_stack_by_bb[bb] = _closest_stack(stack_keys, bb)
+
+    advice_table = {}
+    for stack, data_for_stack in ranges.items():
+        for position, percentage in data_for_stack.items():
+            tips_str = (f"At ~{stack:.1f}BB in {position}, pushing around {percentage:.1f}% of hands is suggested. "
+                        "Adjust for ICM or if players are calling more tightly/loosely.")
+            advice_table[(stack, position)] = (
+                f"Push top {percentage:.1f}%",
+                get_top_hands_by_percentage(percentage),
+                percentage,
+                tips_str,
+            )
+    return stack_keys, closest_stack_by_bb, advice_table
+
+
+########################
+# Lazy load of "push ranges.csv"
+########################
+def _load_push_fold_ranges():
+    """
+    Loads 'push ranges.csv' (next to this file) and builds the advice tables
+    the first time push/fold data is needed, so importing this module does no
+    disk I/O. Later calls just return PUSH_FOLD_RANGES.
+    """
+    global PUSH_FOLD_RANGES, _STACK_KEYS, _CLOSEST_STACK_BY_BB, _ADVICE_TABLE, _push_fold_loaded
+    if _push_fold_loaded:
+        return PUSH_FOLD_RANGES
+    _push_fold_loaded = True
+    try:
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        csv_file_path = os.path.join(module_dir, "push ranges.csv")
+        if os.path.isfile(csv_file_path):
+            with open(csv_file_path, 'r', encoding='utf-8', newline='') as f:
+                loaded = parse_push_fold_csv(f)
+            if loaded:
+                PUSH_FOLD_RANGES = loaded
+                print("INFO: push_fold_data loaded from 'push ranges.csv'.")
+            else:
+                print("WARNING: 'push ranges.csv' parsed but got empty data dictionary.")
         else:
-            print("WARNING: 'push ranges.csv' parsed but got empty data dictionary.")
-    else:
-        print(f"WARNING: 'push ranges.csv' not found in {csv_file_path}. The CSV data won't be available.")
-except Exception as e:
-    print(f"ERROR loading 'push ranges.csv' at import: {e}")
+            print(f"WARNING: 'push ranges.csv' not found in {csv_file_path}. The CSV data won't be available.")
+    except Exception as e:
+        print(f"ERROR loading 'push ranges.csv': {e}")
+    _STACK_KEYS, _CLOSEST_STACK_BY_BB, _ADVICE_TABLE = _build_push_fold_tables(PUSH_FOLD_RANGES)
+    return PUSH_FOLD_RANGES
 
 
 ########################
@@ -223,106 +307,87 @@ def get_push_fold_advice(stack_bb, position, players_left):
     Provides push/fold advice based on:
       stack_bb, position, players_left.
     Returns a 4-tuple:
-      (advice_str, range_list, percentage_float, tips_str)
+      (advice_str, range_tuple, percentage_float, tips_str)
     Example:
-      -> ("Push top 18.0%", ["A2s","A3s","TT","JJ"], 18.0, "some tips")
+      -> ("Push top 18.0%", ("A2s","A3s","TT","JJ"), 18.0, "some tips")
     """
     if not isinstance(stack_bb, (int,float)) or stack_bb <= 0:
-        return ("Error: Invalid Stack Size.", [], None, "No tips - invalid stack.")
+        return ("Error: Invalid Stack Size.", (), None, "No tips - invalid stack.")
     
-    # Make sure data is loaded
-    if not PUSH_FOLD_RANGES:
-        # We might attempt to load again or just error
-        return ("Error: 'push ranges.csv' data not loaded.", [], None, "No tips - data missing.")
+    # Make sure data is loaded (first call reads the CSV)
+    if not _load_push_fold_ranges():
+        return ("Error: 'push ranges.csv' data not loaded.", (), None, "No tips - data missing.")
 
     # Validate position
     # Our CSV uses columns = SB,B,CO,HJ,LJ,UTG+3,UTG+2,UTG+1,UTG
     if position not in ['SB','B','CO','HJ','LJ','UTG+3','UTG+2','UTG+1','UTG']:
-        return (f"Error: Invalid position '{position}'.", [], None, "No tips - invalid position.")
+        return (f"Error: Invalid position '{position}'.", (), None, "No tips - invalid position.")
     
     # Validate players_left
     if not isinstance(players_left, int) or players_left < 2 or players_left > 10:
-        return ("Error: Invalid players_left (2-10).", [], None, "No tips - invalid player count.")
-
-    # Find the closest stack in PUSH_FOLD_RANGES
-    stack_keys = sorted(PUSH_FOLD_RANGES.keys())
-    if not stack_keys:
-        return ("Error: No stack data found in memory.", [], None, "No tips - no data.")
-    # find closest
-    try:
-        closest_stack = min(stack_keys, key=lambda x: abs(x - stack_bb))
-    except Exception as e:
-        return (f"Error: Could not find nearest stack for {stack_bb}BB.", [], None, f"No tips - stack error: {e}")
-
-    data_for_stack = PUSH_FOLD_RANGES.get(closest_stack)
-    if not isinstance(data_for_stack, dict):
-        return (f"Error: Data for {closest_stack}BB not found or invalid format.", [], None, "No tips - data error.")
-
-    percentage = data_for_stack.get(position, None)
-    if percentage is None:
-        return (f"Error: Position '{position}' not found for stack={closest_stack}BB.", [], None, "No tips - data mismatch.")
-    if not isinstance(percentage, (int,float)):
-        return (f"Error: Invalid percentage for pos='{position}', stack={closest_stack}BB => {percentage}", [], None, "No tips - data mismatch.")
-
-    # Get the top range
-    push_range_list = get_top_hands_by_percentage(percentage)
+        return ("Error: Invalid players_left (2-10).", (), None, "No tips - invalid player count.")
 
-    # Advice
-    advice_str = f"Push top {percentage:.1f}%"
-    # Tips string (customize as needed)
-    tips_str = (f"At ~{closest_stack:.1f}BB in {position}, pushing around {percentage:.1f}% of hands is suggested. "
-                "Adjust for ICM or if players are calling more tightly/loosely.")
+    # Find the closest stack in PUSH_FOLD_RANGES (whole-BB stacks are precomputed)
+    closest_stack = _CLOSEST_STACK_BY_BB.get(stack_bb)
+    if closest_stack is None:
+        if not _STACK_KEYS:
+            return ("Error: No stack data found in memory.", (), None, "No tips - no data.")
+        closest_stack = _closest_stack(_STACK_KEYS, stack_bb)
 
-    return (advice_str, push_range_list, percentage, tips_str)
+    advice = _ADVICE_TABLE.get((closest_stack, position))
+    if advice is None:
+        return (f"Error: Position '{position}' not found for stack={closest_stack}BB.", (), None, "No tips - data mismatch.")
+    return advice
 
 
 
 ########################
 # Additional calculations if needed
 # (Pot Odds, MDF, etc.) 
+# These raise ValueError with a readable message on invalid input.
 ########################
 
 def calculate_pot_odds(amount_to_call, pot_size_before_call):
     """Calculates Pot Odds as a percentage."""
     if not isinstance(amount_to_call, (int, float)) or not isinstance(pot_size_before_call, (int, float)):
-        return "Invalid Input: Numeric values required."
+        raise ValueError("Invalid Input: Numeric values required.")
     if amount_to_call <= 0:
-        return "Invalid Input: Call must be > 0."
+        raise ValueError("Invalid Input: Call must be > 0.")
     final_pot_size = pot_size_before_call + amount_to_call
     if final_pot_size <= 0:
-        return "Invalid Calculation: Final pot non-positive."
+        raise ValueError("Invalid Calculation: Final pot non-positive.")
     pot_odds_decimal = amount_to_call / final_pot_size
     return pot_odds_decimal * 100
 
 def calculate_required_equity(amount_to_call, pot_size_before_call):
     """Calculates the minimum equity required to break even on a call."""
     if not isinstance(amount_to_call, (int, float)) or not isinstance(pot_size_before_call, (int, float)):
-        return "Invalid Input: Numeric values required."
+        raise ValueError("Invalid Input: Numeric values required.")
     if amount_to_call <= 0:
-        return "Invalid Input: Call must be > 0."
+        raise ValueError("Invalid Input: Call must be > 0.")
     denominator = pot_size_before_call + amount_to_call
     if denominator <= 0:
-        return "Invalid Calculation: Total pot non-positive."
+        raise ValueError("Invalid Calculation: Total pot non-positive.")
     required_equity_decimal = amount_to_call / denominator
     return required_equity_decimal * 100
 
 def calculate_equity_from_outs(outs, street):
     """Calculates approximate equity using the Rule of 2 and 4."""
     if not isinstance(outs, int) or not (0 <= outs <= 47): # Allow 0 outs
-        return "Invalid Input: Outs must be 0-47."
+        raise ValueError("Invalid Input: Outs must be 0-47.")
     if not isinstance(street, str):
-        return "Invalid Input: Street must be 'flop' or 'turn'."
+        raise ValueError("Invalid Input: Street must be 'flop' or 'turn'.")
     street_lower = street.lower()
     if street_lower == 'flop': return min(outs * 4, 100)
     elif street_lower == 'turn': return min(outs * 2, 100)
-    else: return "Invalid Input: Street must be 'flop' or 'turn'."
+    else: raise ValueError("Invalid Input: Street must be 'flop' or 'turn'.")
 
 def calculate_mdf(bet_size, pot_size_before_bet):
     """Calculates the Minimum Defense Frequency (MDF) as a percentage."""
     if not isinstance(bet_size, (int, float)) or not isinstance(pot_size_before_bet, (int, float)):
-        return "Invalid Input: Numeric values required."
+        raise ValueError("Invalid Input: Numeric values required.")
     if bet_size <= 0 or pot_size_before_bet < 0:
-        return "Invalid Input: Bet > 0, Pot >= 0."
+        raise ValueError("Invalid Input: Bet > 0, Pot >= 0.")
     pot_after_bet = pot_size_before_bet + bet_size
     mdf_decimal = pot_size_before_bet / pot_after_bet
     return mdf_decimal * 100
@@ -330,9 +395,9 @@ def calculate_mdf(bet_size, pot_size_before_bet):
 def calculate_bluff_break_even(bet_size, pot_size_before_bet):
     """Calculates the frequency a bluff needs to work to be break-even."""
     if not isinstance(bet_size, (int, float)) or not isinstance(pot_size_before_bet, (int, float)):
-        return "Invalid Input: Numeric values required."
+        raise ValueError("Invalid Input: Numeric values required.")
     if bet_size <= 0 or pot_size_before_bet < 0:
-        return "Invalid Input: Bet > 0, Pot >= 0."
+        raise ValueError("Invalid Input: Bet > 0, Pot >= 0.")
     pot_plus_bet = pot_size_before_bet + bet_size
     break_even_decimal = bet_size / pot_plus_bet
     return break_even_decimal * 100
@@ -348,9 +413,9 @@ def parse_card_input(card_text):
 def calculate_spr(effective_stack, pot_size):
     """Calculates the Stack-to-Pot Ratio (SPR)."""
     if not isinstance(effective_stack, (int, float)) or not isinstance(pot_size, (int, float)):
-        return "Invalid Input: Numeric values required."
+        raise ValueError("Invalid Input: Numeric values required.")
     if effective_stack < 0 or pot_size <= 0:
-        return "Invalid Input: Stack >= 0, Pot > 0."
+        raise ValueError("Invalid Input: Stack >= 0, Pot > 0.")
     if pot_size < 1e-9: return float('inf')
     spr = effective_stack / pot_size
     return spr
@@ -358,26 +423,50 @@ def calculate_spr(effective_stack, pot_size):
 def calculate_bet_size(pot_size, fraction):
     """Calculates the bet size based on a fraction of the pot."""
     if not isinstance(pot_size, (int, float)) or not isinstance(fraction, (int, float)):
-        return "Invalid Input: Numeric values required."
+        raise ValueError("Invalid Input: Numeric values required.")
     if pot_size <= 0 or fraction <= 0:
-        return "Invalid Input: Pot > 0, Fraction > 0."
+        raise ValueError("Invalid Input: Pot > 0, Fraction > 0.")
     bet_size = pot_size * fraction
     return bet_size
 
 def calculate_icm(chip_stacks, payouts):
-    """Calculates tournament equity ($EV) using a simplified CHIP CHOP model (NOT true ICM)."""
+    """
+    Calculates tournament equity ($EV) using the Malmuth-Harville ICM model.
+    Places are handed out top-down: each still-unplaced player takes the next
+    place with probability stack / (chips of all unplaced players).
+    States are bitmasks over the original player indices, processed one
+    place (popcount level) at a time, so results stay in chip_stacks order
+    even when stacks are equal.
+    """
     num_players = len(chip_stacks)
     if num_players == 0: return []
     if not payouts or len(payouts) < num_players: return ["Error: Insufficient payouts provided."] * num_players
     total_chips_final = sum(chip_stacks)
     if total_chips_final <= 0: return ["Error: Total chips must be > 0."] * num_players
+    if any(stack < 0 for stack in chip_stacks): return ["Error: Negative stack size."] * num_players
     relevant_payouts = payouts[:num_players]
-    total_payout_final = sum(relevant_payouts)
-    result_ev = []
-    for stack in chip_stacks:
-        if stack < 0: return ["Error: Negative stack size."] * num_players
-        player_ev = (stack / total_chips_final) * total_payout_final
-        result_ev.append(player_ev)
+    # Places after the last non-zero payout can't change anyone's $EV
+    paid_places = num_players
+    while paid_places > 0 and relevant_payouts[paid_places - 1] == 0:
+        paid_places -= 1
+
+    result_ev = [0.0] * num_players
+    # { mask of still-unplaced players: probability of reaching that state }
+    frontier = {(1 << num_players) - 1: 1.0}
+    for place in range(paid_places):
+        payout = relevant_payouts[place]
+        next_frontier = {}
+        for mask, prob in frontier.items():
+            alive = [i for i in range(num_players) if mask >> i & 1]
+            chips = sum(chip_stacks[i] for i in alive)
+            for i in alive:
+                # Zero-chip players only split the places nobody with chips is left to take
+                p_i = prob * (chip_stacks[i] / chips if chips > 0 else 1.0 / len(alive))
+                if p_i == 0.0: continue
+                result_ev[i] += p_i * payout
+                rest = mask ^ (1 << i)
+                next_frontier[rest] = next_frontier.get(rest, 0.0) + p_i
+        frontier = next_frontier
     return result_ev
 
 
@@ -463,30 +552,132 @@ def generate_combos(hand_range_list):
         if len(hand_str) == 2: # Pair
             rank = hand_str[0]
             if rank not in RANKS or hand_str[1] != rank : continue
-            suits_for_pair = list(SUITS_TREYS)
-            for s1, s2 in itertools.combinations(suits_for_pair, 2):
-                try: combos.append([Card.new(rank + s1), Card.new(rank + s2)])
-                except ValueError: continue
+            rank_cards = _CARD_INT[rank]
+            for s1, s2 in _PAIR_SUITS:
+                combos.append([rank_cards[s1], rank_cards[s2]])
         elif len(hand_str) == 3: # Non-pair
             rank1, rank2, type = hand_str[0], hand_str[1], hand_str[2]
             if rank1 not in RANKS or rank2 not in RANKS or rank1 == rank2: continue
+            rank1_cards, rank2_cards = _CARD_INT[rank1], _CARD_INT[rank2]
             if type == 's':
                 for suit in SUITS_TREYS:
-                    try: combos.append([Card.new(rank1 + suit), Card.new(rank2 + suit)])
-                    except ValueError: continue
+                    combos.append([rank1_cards[suit], rank2_cards[suit]])
             elif type == 'o':
-                for s1 in SUITS_TREYS:
-                    for s2 in SUITS_TREYS:
-                        if s1 != s2:
-                            try: combos.append([Card.new(rank1 + s1), Card.new(rank2 + s2)])
-                            except ValueError: continue
+                for s1, s2 in _OFFSUIT_SUITS:
+                    combos.append([rank1_cards[s1], rank2_cards[s2]])
     return combos
 
 
-def calculate_hand_vs_range_equity(hero_hand_str, villain_range_list, board_str_list, simulations=10000):
-    """Calculates hero's equity against a villain range on a given board via Monte Carlo."""
+def _cards_to_bits(cards):
+    """ORs the _CARD_BIT of each treys card int into one 52-bit mask."""
+    bits = 0
+    for card in cards:
+        bits |= _CARD_BIT[card]
+    return bits
+
+
+@lru_cache(maxsize=4096)
+def _combos_for_range(range_frozen):
+    """
+    Cached generate_combos keyed by the frozenset of canonical hands.
+    Returns (combos, combo_bits) where combo_bits[i] is the 52-bit card mask
+    of combos[i] as a read-only uint64 array. Do not mutate the result.
+    """
+    combos = tuple(generate_combos(list(range_frozen)))
+    combo_bits = np.array([_CARD_BIT[c1] | _CARD_BIT[c2] for c1, c2 in combos], dtype=np.uint64)
+    combo_bits.setflags(write=False)
+    return combos, combo_bits
+
+
+def _build_rank_tables():
+    """
+    Copies treys' lookup tables into arrays so whole batches of hands can be ranked at once:
+    - flush_rank[rank_bits] for the 13-bit rank mask of any 5-card flush
+    - unsuited_keys (sorted prime products) / unsuited_ranks for everything else
+    Ranks are treys' (1 = royal flush ... 7462 = worst high card).
+    """
+    if LookupTable is None:
+        return None, None, None
+    table = LookupTable()
+    flush_rank = np.zeros(1 << 13, dtype=np.int16)
+    for rank_bits in range(1 << 13):
+        if bin(rank_bits).count('1') == 5:
+            flush_rank[rank_bits] = table.flush_lookup[Card.prime_product_from_rankbits(rank_bits)]
+    unsuited_keys = sorted(table.unsuited_lookup)
+    unsuited_ranks = np.array([table.unsuited_lookup[k] for k in unsuited_keys], dtype=np.int16)
+    return flush_rank, np.array(unsuited_keys, dtype=np.int64), unsuited_ranks
+
+_FLUSH_RANK, _UNSUITED_KEYS, _UNSUITED_RANKS = _build_rank_tables()
+# The 21 ways to keep 5 of 7 cards
+_FIVE_OF_SEVEN = np.array(list(itertools.combinations(range(7), 5)), dtype=np.intp)
+
+# Each subset split into its hole-card part (positions 0-1) and board part (positions 2-6),
+# padded with an index one past the real cards that _subset_parts points at an identity value
+_SUBSET_HOLE_IDX = np.array([[i for i in sub if i < 2] + [2] * (2 - sum(i < 2 for i in sub))
+                             for sub in itertools.combinations(range(7), 5)], dtype=np.intp)
+_SUBSET_BOARD_IDX = np.array([[i - 2 for i in sub if i >= 2] + [5] * sum(i < 2 for i in sub)
+                              for sub in itertools.combinations(range(7), 5)], dtype=np.intp)
+
+def _rank_subsets(suit_and, rank_or, prime_product):
+    """Best treys rank per row, given the AND, OR and rank-prime product of every 5-card subset."""
+    is_flush = (suit_and & 0xF000) != 0
+    flush = _FLUSH_RANK[rank_or >> 16]
+    # Prime product of the 5 ranks (card & 0xFF) is a perfect hash for non-flush hands
+    unsuited = _UNSUITED_RANKS[np.searchsorted(_UNSUITED_KEYS, prime_product)]
+    return np.where(is_flush, flush, unsuited).min(axis=1)
+
+def _evaluate7_batch(cards):
+    """
+    Ranks many 7-card hands at once, same result as Evaluator.evaluate per row.
+    cards: int32 array of shape (n, 7) holding treys card ints (they fit in 29 bits)
+    Returns an int16 array of shape (n,) (lower is better).
+    """
+    fives = cards[:, _FIVE_OF_SEVEN]  # (n, 21, 5)
+    return _rank_subsets(np.bitwise_and.reduce(fives, axis=2), np.bitwise_or.reduce(fives, axis=2),
+                         np.prod(fives & 0xFF, axis=2, dtype=np.int64))
+
+def _subset_parts(cards, idx):
+    """AND, OR and rank-prime product of cards over each row of idx (pad index -> identity)."""
+    def gather(values, identity):
+        padded = np.concatenate((values, np.full((len(values), 1), identity, dtype=values.dtype)), axis=1)
+        return padded[:, idx]
+    return (np.bitwise_and.reduce(gather(cards, -1), axis=2),
+            np.bitwise_or.reduce(gather(cards, 0), axis=2),
+            np.prod(gather(cards & 0xFF, 1), axis=2, dtype=np.int64))
+
+def _evaluate7_pair(hero_hole, villain_holes, boards):
+    """
+    Ranks hero and villain on the same boards in one pass: the board's share of every
+    5-card subset is reduced once and combined with each player's hole cards.
+    hero_hole: (2,) int32; villain_holes: (n, 2) int32; boards: (n, 5) int32
+    Returns (hero_ranks, villain_ranks), each like _evaluate7_batch.
+    """
+    b_and, b_or, b_prod = _subset_parts(boards, _SUBSET_BOARD_IDX)  # (n, 21) each
+    h_and, h_or, h_prod = _subset_parts(hero_hole[None, :], _SUBSET_HOLE_IDX)  # (1, 21), broadcast
+    v_and, v_or, v_prod = _subset_parts(villain_holes, _SUBSET_HOLE_IDX)
+    return (_rank_subsets(b_and & h_and, b_or | h_or, b_prod * h_prod),
+            _rank_subsets(b_and & v_and, b_or | v_or, b_prod * v_prod))
+
+
+# Equity simulations draw villain hands and runouts this many at a time
+_SIM_BATCH = 1024
+# Shared PCG64 generator for simulations that aren't given their own rng
+_RNG = np.random.default_rng()
+
+# Board cards known on each street
+_STREET_BOARD_LEN = {'preflop': 0, 'flop': 3, 'turn': 4, 'river': 5}
+
+def calculate_hand_vs_range_equity(hero_hand_str, villain_range_list, board_str_list, simulations=10000, rng=None, streets=None):
+    """
+    Calculates hero's equity against a villain range on a given board via Monte Carlo.
+    rng: optional seed or numpy Generator, for reproducible results
+    streets: None simulates only from the full given board and returns a float.
+             An iterable such as ('preflop', 'flop', 'turn', 'river') returns a dict
+             keyed by street, each simulated from that street's board; streets the
+             board hasn't reached yet are None.
+    """
     # (Code from previous correct version)
-    evaluator = Evaluator()
+    if Card is None: print("ERROR: 'treys' is required for equity calculations."); return None
     hero_cards = hand_string_to_treys_cards(hero_hand_str)
     if not hero_cards: print(f"ERROR: Invalid hero hand format: {hero_hand_str}"); return None
     if len(set(hero_cards)) != 2: print(f"ERROR: Duplicate cards in hero hand: {hero_hand_str}"); return None
@@ -495,37 +686,86 @@ def calculate_hand_vs_range_equity(hero_hand_str, villain_range_list, board_str_
     if len(board_cards) > 5: print(f"ERROR: Board cannot have more than 5 cards: {len(board_cards)}"); return None
     known_dead_cards = hero_cards + board_cards
     if len(set(known_dead_cards)) != len(known_dead_cards): print(f"ERROR: Conflict between hero hand and board cards: {hero_hand_str} | {board_str_list}"); return None
-    villain_combos_all = generate_combos(villain_range_list)
+    if not isinstance(villain_range_list, (list, tuple, set, frozenset)): print(f"ERROR: Invalid villain range: {villain_range_list}"); return None
+    if streets is not None:
+        streets = list(streets)
+        unknown = [st for st in streets if st not in _STREET_BOARD_LEN]
+        if unknown: print(f"ERROR: Unknown street(s): {unknown}"); return None
+    villain_combos_all, villain_combo_bits = _combos_for_range(frozenset(h for h in villain_range_list if isinstance(h, str)))
     if not villain_combos_all: print("ERROR: Villain range generated no valid combos."); return None
-    valid_villain_combos = [combo for combo in villain_combos_all if not any(card in known_dead_cards for card in combo)]
+    rng = _RNG if rng is None else np.random.default_rng(rng)  # a Generator passes through unchanged
+    if streets is None:
+        return _simulate_equity(hero_cards, board_cards, villain_combos_all, villain_combo_bits, simulations, rng)
+    results = dict.fromkeys(_STREET_BOARD_LEN)
+    for street in streets:
+        n_board = _STREET_BOARD_LEN[street]
+        if n_board <= len(board_cards):
+            results[street] = _simulate_equity(hero_cards, board_cards[:n_board], villain_combos_all, villain_combo_bits, simulations, rng)
+    return results
+
+def _simulate_equity(hero_cards, board_cards, villain_combos_all, villain_combo_bits, simulations, rng):
+    """Monte Carlo runouts from board_cards; returns hero equity in percent (None if nothing ran)."""
+    known_dead_cards = hero_cards + board_cards
+    # Drop combos that share a card with hero/board: one vectorized AND over all combo masks
+    dead_bits = np.uint64(_cards_to_bits(known_dead_cards))
+    valid_villain_combos = [villain_combos_all[i] for i in np.flatnonzero((villain_combo_bits & dead_bits) == 0)]
     if not valid_villain_combos: print("Warning: No valid villain combos remain after removing known dead cards."); return 0.0
     wins = 0; ties = 0; total_sims_run = 0
     cards_to_deal = 5 - len(board_cards)
-    for i in range(simulations):
-        try:
-            villain_hand = random.choice(valid_villain_combos)
-            current_dead_cards = known_dead_cards + villain_hand
-            if len(set(current_dead_cards)) != len(current_dead_cards): continue
-            deck = Deck()
-            dead_card_ints = set(c for c in current_dead_cards)
-            deck.cards = [card for card in deck.cards if card not in dead_card_ints]
-            runout_board = list(board_cards)
-            if cards_to_deal > 0:
-                 if len(deck.cards) < cards_to_deal: continue
-                 drawn_cards = deck.draw(cards_to_deal)
-                 if not isinstance(drawn_cards, list): drawn_cards = [drawn_cards]
-                 runout_board.extend(drawn_cards)
-            if len(runout_board) != 5: continue
-            hero_score = evaluator.evaluate(hero_cards, runout_board)
-            villain_score = evaluator.evaluate(villain_hand, runout_board)
-            total_sims_run += 1
-            if hero_score < villain_score: wins += 1
-            elif hero_score == villain_score: ties += 1
-        except Exception as e: print(f"UNEXPECTED ERROR during simulation run {i+1}: {e}. Skipping."); continue
+    known_dead_set = frozenset(known_dead_cards)
+    live_cards = np.array([c for c in ALL_52 if c not in known_dead_set], dtype=np.int32)  # hero + board removed once
+    # Where each valid villain combo's cards sit inside live_cards, so a runout can skip them
+    live_pos = {c: i for i, c in enumerate(live_cards.tolist())}
+    villain_live_pos = np.array([[live_pos[c1], live_pos[c2]] for c1, c2 in valid_villain_combos], dtype=np.intp)
+    hero_arr = np.array(hero_cards, dtype=np.int32)
+    board_arr = np.array(board_cards, dtype=np.int32)
+    villain_arr = np.array(valid_villain_combos, dtype=np.int32)  # (combos, 2)
+    if cards_to_deal == 0 or (cards_to_deal == 1 and len(villain_arr) * len(live_cards) <= simulations):
+        # Few enough distinct outcomes to rank each one once instead of re-sampling them
+        return _exact_equity(hero_arr, board_arr, villain_arr, live_cards)
+    for batch_start in range(0, simulations, _SIM_BATCH):
+        batch = min(_SIM_BATCH, simulations - batch_start)
+        villain_idx = rng.integers(0, len(valid_villain_combos), size=batch)
+        boards = np.broadcast_to(board_arr, (batch, len(board_arr)))
+        if cards_to_deal > 0:
+            # The cards_to_deal smallest random keys of a row are a uniform runout;
+            # the villain's two cards get keys above [0, 1) so they are never dealt.
+            keys = rng.random((batch, len(live_cards)), dtype=np.float32)  # only their order matters
+            keys[np.arange(batch)[:, None], villain_live_pos[villain_idx]] = 2.0
+            runouts = live_cards[np.argpartition(keys, cards_to_deal - 1, axis=1)[:, :cards_to_deal]]
+            boards = np.concatenate((boards, runouts), axis=1)
+        # Combos were filtered against hero/board and runouts skip the villain's
+        # cards, so every row below is 7 distinct cards.
+        villain_holes = villain_arr[villain_idx]
+        # Audit of that invariant for debug runs only (stripped under python -O)
+        assert (np.diff(np.sort(np.concatenate((villain_holes, boards), axis=1), axis=1), axis=1) != 0).all(), "duplicate card dealt"
+        hero_ranks, villain_ranks = _evaluate7_pair(hero_arr, villain_holes, boards)
+        wins += int(np.count_nonzero(hero_ranks < villain_ranks))
+        ties += int(np.count_nonzero(hero_ranks == villain_ranks))
+        total_sims_run += batch
     if total_sims_run == 0: print("ERROR: No simulations were successfully run."); return None
     equity = (wins + (ties / 2.0)) / total_sims_run
     return equity * 100.0
 
+def _exact_equity(hero_arr, board_arr, villain_arr, live_cards):
+    """
+    Exact hero equity in percent on a river (5-card) or turn (4-card) board:
+    every villain combo against every possible river card, each ranked once.
+    """
+    if len(board_arr) == 5:
+        boards = board_arr[None, :]
+    else:  # Turn: each live card is a possible river
+        boards = np.concatenate((np.broadcast_to(board_arr, (len(live_cards), 4)), live_cards[:, None]), axis=1)
+    n_combos, n_boards = len(villain_arr), len(boards)
+    hero_ranks = _evaluate7_batch(np.concatenate((np.broadcast_to(hero_arr, (n_boards, 2)), boards), axis=1))
+    villain_hands = np.concatenate((np.repeat(villain_arr, n_boards, axis=0), np.tile(boards, (n_combos, 1))), axis=1)
+    villain_ranks = _evaluate7_batch(villain_hands).reshape(n_combos, n_boards)
+    # A river card the villain is holding can't come (always possible on a full board)
+    possible = (villain_arr[:, :, None] != boards[None, None, :, -1]).all(axis=1) | (len(board_arr) == 5)
+    wins = np.count_nonzero((hero_ranks < villain_ranks) & possible)
+    ties = np.count_nonzero((hero_ranks == villain_ranks) & possible)
+    return float((wins + ties / 2.0) / np.count_nonzero(possible) * 100.0)
+
 # --- Example Usage ---
 if __name__ == "__main__":
     print("-" * 20)
@@ -552,7 +792,7 @@ if __name__ == "__main__":
     stacks = [1000, 500, 200]
     pays = [100, 60, 40]
     icm_ev = calculate_icm(stacks, pays)
-    print(f"ICM EV (Chip Chop Placeholder) for Stacks {stacks}, Payouts {pays}:")
+    print(f"ICM EV (Malmuth-Harville) for Stacks {stacks}, Payouts {pays}:")
     if icm_ev and isinstance(icm_ev[0], str): print(icm_ev[0]) # Print error if needed
     elif icm_ev:
         for i, ev in enumerate(icm_ev): print(f" Player {i+1}: ${ev:.2f}")
@@ -1,5 +1,6 @@
 # poker_tool_app.py
 import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
 from poker_logic import (
     calculate_pot_odds,
     calculate_required_equity,
@@ -16,6 +17,7 @@ from poker_logic import (
     calculate_hand_vs_range_equity,
     # parse_card_input,
     RANKS,
+    RANK_ORDER,
     get_all_hands # Need this for parsing ranges
 )
 from push_fold_trainer_frame import PushFoldTrainerFrame
@@ -58,7 +60,7 @@ def format_range_to_text(selected_hands_set):
     if pairs:
         current_range = [pairs[0]]
         for i in range(1, len(pairs)):
-            if RANKS.index(pairs[i]) != RANKS.index(pairs[i-1]) - 1:
+            if RANK_ORDER[pairs[i]] != RANK_ORDER[pairs[i-1]] - 1:
                 # Gap in sequence, end current range
                 if len(current_range) > 2:
                     result.append(f"{current_range[-1]}{current_range[-1]}-{current_range[0]}{current_range[0]}")
@@ -79,7 +81,7 @@ def format_range_to_text(selected_hands_set):
     
     # Process suited hands
     for first_card in sorted(suited.keys()):
-        second_cards = sorted(suited[first_card], key=lambda x: RANKS.index(x))
+        second_cards = sorted(suited[first_card], key=RANK_ORDER.__getitem__)
         if len(second_cards) > 2:
             result.append(f"{first_card}{second_cards[-1]}s-{first_card}{second_cards[0]}s")
         else:
@@ -88,7 +90,7 @@ def format_range_to_text(selected_hands_set):
     
     # Process offsuit hands
     for first_card in sorted(offsuit.keys()):
-        second_cards = sorted(offsuit[first_card], key=lambda x: RANKS.index(x))
+        second_cards = sorted(offsuit[first_card], key=RANK_ORDER.__getitem__)
         if len(second_cards) > 2:
             result.append(f"{first_card}{second_cards[-1]}o-{first_card}{second_cards[0]}o")
         else:
@@ -204,8 +206,8 @@ def parse_dashed_pairs_range(hands_set, start_pair, end_pair, all_hands_list):
       - E.g. start_pair='99' => first rank='9', end_pair='22' => rank='2'
     """
     try:
-        start_idx = RANKS.index(start_pair[0])
-        end_idx   = RANKS.index(end_pair[0])
+        start_idx = RANK_ORDER[start_pair[0]]
+        end_idx   = RANK_ORDER[end_pair[0]]
         # If reversed, swap
         if start_idx > end_idx:
             start_idx, end_idx = end_idx, start_idx
@@ -213,7 +215,7 @@ def parse_dashed_pairs_range(hands_set, start_pair, end_pair, all_hands_list):
             pair_str = f"{RANKS[i]}{RANKS[i]}"
             if pair_str in all_hands_list:
                 hands_set.add(pair_str)
-    except (ValueError, IndexError):
+    except (KeyError, IndexError):
         pass
 
 
@@ -239,15 +241,15 @@ def parse_dashed_combo_range(hands_set, start_str, end_str, all_hands_list):
         return  # skip or handle differently
 
     try:
-        start_idx = RANKS.index(sr2)
-        end_idx   = RANKS.index(er2)
+        start_idx = RANK_ORDER[sr2]
+        end_idx   = RANK_ORDER[er2]
         if start_idx > end_idx:
             start_idx, end_idx = end_idx, start_idx
         for i in range(start_idx, end_idx + 1):
             candidate = f"{sr1}{RANKS[i]}{stype}"  # e.g. 'A2s', 'A3s', ... 'AKs'
             if candidate in all_hands_list:
                 hands_set.add(candidate)
-    except (ValueError, IndexError):
+    except (KeyError, IndexError):
         pass
 
 
@@ -256,12 +258,12 @@ def parse_pairs_plus(hands_set, pair_str, all_hands_list):
     e.g. "TT+" => TT, JJ, QQ, KK, AA
     """
     try:
-        base_idx = RANKS.index(pair_str[0])  # 'T'
+        base_idx = RANK_ORDER[pair_str[0]]  # 'T'
         for i in range(base_idx, -1, -1):    # down to 'A'
             candidate = f"{RANKS[i]}{RANKS[i]}"
             if candidate in all_hands_list:
                 hands_set.add(candidate)
-    except (ValueError, IndexError):
+    except (KeyError, IndexError):
         pass
 
 
@@ -274,13 +276,13 @@ def parse_suited_offsuit_plus(hands_set, base_str, all_hands_list):
     """
     rank1, rank2, ctype = base_str[0], base_str[1], base_str[2]  # e.g. 'A','9','s'
     try:
-        idx_start = RANKS.index(rank2)
+        idx_start = RANK_ORDER[rank2]
         idx_end   = len(RANKS) - 1  # '2' is last in RANKS
         for i in range(idx_start, idx_end + 1):
             candidate = f"{rank1}{RANKS[i]}{ctype}"
             if candidate in all_hands_list:
                 hands_set.add(candidate)
-    except (ValueError, IndexError):
+    except (KeyError, IndexError):
         pass
 
 
@@ -320,6 +322,11 @@ BUTTON_WIDTH = 42
 BUTTON_HEIGHT = 32
 BUTTON_CORNER_RADIUS = 6
 
+# --- Background work ---
+# One worker: equity runs are queued rather than competing for the CPU
+_EQUITY_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+EQUITY_POLL_MS = 50  # How often the UI checks for a finished equity run
+
 # --- GraphicalCardSelector Class ---
 class GraphicalCardSelector(ctk.CTkFrame):
     """A graphical card selector that displays ranks and suits as buttons."""
@@ -755,11 +762,12 @@ class PotOddsModule(BaseCalculatorModule):
         call = self._get_float_from_entry(self.call_entry)
         pot = self._get_float_from_entry(self.pot_entry)
         if call is not None and pot is not None:
-            result = calculate_pot_odds(call, pot)
-            if isinstance(result, (int, float)):
-                self.result_label.configure(text=f"Pot Odds: {result:.2f}%")
+            try:
+                result = calculate_pot_odds(call, pot)
+            except ValueError as e:
+                self.result_label.configure(text=f"Pot Odds: {e}")
             else:
-                 self.result_label.configure(text=f"Pot Odds: {result}")
+                self.result_label.configure(text=f"Pot Odds: {result:.2f}%")
         else:
              self.result_label.configure(text="Pot Odds: - %")
 
@@ -786,11 +794,12 @@ class RequiredEquityModule(BaseCalculatorModule):
         call = self._get_float_from_entry(self.call_entry)
         pot = self._get_float_from_entry(self.pot_entry)
         if call is not None and pot is not None:
-            result = calculate_required_equity(call, pot)
-            if isinstance(result, (int, float)):
-                self.result_label.configure(text=f"Req. Equity: {result:.2f}%")
+            try:
+                result = calculate_required_equity(call, pot)
+            except ValueError as e:
+                self.result_label.configure(text=f"Req. Equity: {e}")
             else:
-                 self.result_label.configure(text=f"Req. Equity: {result}")
+                self.result_label.configure(text=f"Req. Equity: {result:.2f}%")
         else:
              self.result_label.configure(text="Req. Equity: - %")
 
@@ -817,12 +826,13 @@ class OutsEquityModule(BaseCalculatorModule):
         outs = self._get_int_from_entry(self.outs_entry)
         street = self.street_var.get()
         if outs is not None:
-            result = calculate_equity_from_outs(outs, street)
-            if isinstance(result, (int, float)):
+            try:
+                result = calculate_equity_from_outs(outs, street)
+            except ValueError as e:
+                self.result_label.configure(text=f"Approx. Equity: {e}")
+            else:
                 # TODO: Later, adjust 'outs' based on board cards if available
                 self.result_label.configure(text=f"Approx. Equity: {result:.1f}%")
-            else:
-                 self.result_label.configure(text=f"Approx. Equity: {result}")
         else:
             self.result_label.configure(text="Approx. Equity: - %")
 
@@ -849,11 +859,12 @@ class MdfModule(BaseCalculatorModule):
         bet = self._get_float_from_entry(self.bet_entry)
         pot = self._get_float_from_entry(self.pot_entry)
         if bet is not None and pot is not None:
-            result = calculate_mdf(bet, pot)
-            if isinstance(result, (int, float)):
-                self.result_label.configure(text=f"MDF: {result:.2f}%")
+            try:
+                result = calculate_mdf(bet, pot)
+            except ValueError as e:
+                self.result_label.configure(text=f"MDF: {e}")
             else:
-                 self.result_label.configure(text=f"MDF: {result}")
+                self.result_label.configure(text=f"MDF: {result:.2f}%")
         else:
             self.result_label.configure(text="MDF: - %")
 
@@ -880,11 +891,12 @@ class BluffBreakEvenModule(BaseCalculatorModule):
         bet = self._get_float_from_entry(self.bet_entry)
         pot = self._get_float_from_entry(self.pot_entry)
         if bet is not None and pot is not None:
-            result = calculate_bluff_break_even(bet, pot)
-            if isinstance(result, (int, float)):
-                self.result_label.configure(text=f"Break-Even: {result:.2f}%")
+            try:
+                result = calculate_bluff_break_even(bet, pot)
+            except ValueError as e:
+                self.result_label.configure(text=f"Break-Even: {e}")
             else:
-                 self.result_label.configure(text=f"Break-Even: {result}")
+                self.result_label.configure(text=f"Break-Even: {result:.2f}%")
         else:
             self.result_label.configure(text="Break-Even: - %")
 
@@ -945,11 +957,12 @@ class SprModule(BaseCalculatorModule):
         stack = self._get_float_from_entry(self.stack_entry)
         pot = self._get_float_from_entry(self.pot_entry)
         if stack is not None and pot is not None:
-            result = calculate_spr(stack, pot)
-            if isinstance(result, (int, float)):
-                self.result_label.configure(text=f"SPR: {result:.2f}")
+            try:
+                result = calculate_spr(stack, pot)
+            except ValueError as e:
+                self.result_label.configure(text=f"SPR: {e}")
             else:
-                 self.result_label.configure(text=f"SPR: {result}")
+                self.result_label.configure(text=f"SPR: {result:.2f}")
         else:
             self.result_label.configure(text="SPR: -")
 
@@ -1018,11 +1031,12 @@ class BetSizingModule(BaseCalculatorModule):
         fraction = self._get_float_from_entry(self.fraction_entry)
         
         if pot is not None and fraction is not None:
-            result = calculate_bet_size(pot, fraction)
-            if isinstance(result, (int, float)):
-                self.result_label.configure(text=f"Bet Size: {result:.2f}")
+            try:
+                result = calculate_bet_size(pot, fraction)
+            except ValueError as e:
+                self.result_label.configure(text=f"Bet Size: {e}")
             else:
-                 self.result_label.configure(text=f"Bet Size: {result}")
+                self.result_label.configure(text=f"Bet Size: {result:.2f}")
         else:
             self.result_label.configure(text="Bet Size: -")
 
@@ -1049,7 +1063,7 @@ class IcmModule(BaseCalculatorModule):
         self.grid_columnconfigure(1, weight=1) # Payouts column
         self.grid_columnconfigure(2, weight=1) # Results column
 
-        ctk.CTkLabel(self, text="ICM Calculator (Simplified)").grid(row=0, column=0, columnspan=3, pady=(10, 5), sticky="w")
+        ctk.CTkLabel(self, text="ICM Calculator (Malmuth-Harville)").grid(row=0, column=0, columnspan=3, pady=(10, 5), sticky="w")
 
         # Input Frame
         input_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -1609,9 +1623,23 @@ class HandVsRangeFrame(ctk.CTkFrame):
             return
         # Further validation happens within calculate_hand_vs_range_equity
 
+        # Run calculation (can take time) off the Tk thread; _poll_equity shows the result
+        self.calculate_button.configure(state="disabled")
+        self._equity_future = _EQUITY_EXECUTOR.submit(
+            calculate_hand_vs_range_equity,
+            hero_hand_str, villain_range, board_cards,
+            streets=('preflop', 'flop', 'turn', 'river'))
+        self.after(EQUITY_POLL_MS, self._poll_equity)
+
+    def _poll_equity(self):
+        """Checks the background equity calculation; Tk widgets are only touched from here."""
+        if not self._equity_future.done():
+            self.after(EQUITY_POLL_MS, self._poll_equity)
+            return
+        self.calculate_button.configure(state="normal")
+
         try:
-            # Run calculation (can take time)
-            equity_results = calculate_hand_vs_range_equity(hero_hand_str, villain_range, board_cards)
+            equity_results = self._equity_future.result()
 
             if equity_results:
                 pf = equity_results.get('preflop')
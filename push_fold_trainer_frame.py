@@ -1,22 +1,74 @@
 import os
 import random
+from functools import lru_cache
+import numpy as np
 import customtkinter as ctk
 from PIL import Image
 
 # We assume you have this function in your code or a separate module:
 # from poker_logic import get_push_fold_advice, RANKS
 # For demonstration, we'll define a minimal stand-in here:
+# Cached: the (stack, position, players) space is tiny and the answer never changes.
+@lru_cache(maxsize=1024)
 def get_push_fold_advice(stack, position, players_left):
     """
     Example placeholder logic:
-    Return (advice_string, push_range), where push_range is a list of combos like 'A2s','TT', etc.
+    Return (advice_string, push_range), where push_range is a frozenset of combos like 'A2s','TT', etc.
+    (Immutable since the cached result is shared; a set since callers only test membership.)
     In real code, you'd have your actual logic for short-stack push/fold.
     """
     # We'll just randomly pick some made-up push range:
-    mock_push_range = ["A2s","A3s","A4s","KJo","QJs","TT","JJ","QQ","KK","AA"]
+    mock_push_range = frozenset(("A2s","A3s","A4s","KJo","QJs","TT","JJ","QQ","KK","AA"))
     return ("Push 20% range", mock_push_range)
 
-RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
+RANKS = ("A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2")
+SUITS = ("s", "h", "d", "c")
+SKIP_WAIT_KEYS = ("<Return>", "<space>")  # Skip the pause after an answer
+# A quiz session: one row per question, one column per field
+SCENARIO_DTYPE = np.dtype([('hand', 'U3'), ('stack', 'i1'), ('pos', 'U5'), ('pls', 'i1')])
+
+
+# ---------------------------------------------------
+# 1) LOAD CARD IMAGES (adjust to your file structure)
+# ---------------------------------------------------
+_CARD_IMAGE_CACHE = None  # "As" -> CTkImage, filled on first use
+
+def _load_all_card_images():
+    # We assume you have 52 images in assets/cards/ named like "ace_of_spades.png", "10_of_diamonds.png", etc.
+    rank_map = {
+        'A': 'ace', 'K': 'king', 'Q': 'queen', 'J': 'jack',
+        'T': '10', '9': '9', '8': '8', '7': '7',
+        '6': '6', '5': '5', '4': '4', '3': '3', '2': '2'
+    }
+    suit_map = {
+        's': 'spades', 'h': 'hearts', 'd': 'diamonds', 'c': 'clubs'
+    }
+
+    base_path = "assets/cards"
+    size = (80, 110)
+
+    card_images = {}
+    for r, rname in rank_map.items():
+        for s, sname in suit_map.items():
+            filename = f"{rname}_of_{sname}.png"  # e.g. "ace_of_spades.png"
+            full_path = os.path.join(base_path, filename)
+            if os.path.exists(full_path):
+                pil_img = Image.open(full_path)
+                pil_img.thumbnail(size, Image.Resampling.LANCZOS)  # in place, no extra copy
+                ctk_img = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=size)
+                short_code = f"{r}{s}"  # e.g. "As"
+                card_images[short_code] = ctk_img
+            else:
+                # If missing, skip or log a warning
+                pass
+    return card_images
+
+def _get_card_images():
+    """Loads and resizes the card images once; later frames reuse the same dict."""
+    global _CARD_IMAGE_CACHE
+    if _CARD_IMAGE_CACHE is None:
+        _CARD_IMAGE_CACHE = _load_all_card_images()
+    return _CARD_IMAGE_CACHE
 
 
 class PushFoldTrainerFrame(ctk.CTkFrame):
@@ -26,19 +78,28 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         # Optional: set the overall background color
         self.configure(fg_color="#F4F5F7")
 
+        # Fonts, built once (each CTkFont is a Tk font object) and shared by every label
+        self.title_font = ctk.CTkFont(size=18, weight="bold")
+        self.text_font = ctk.CTkFont(size=14)
+        self.bold_font = ctk.CTkFont(size=14, weight="bold")
+        self.card_fallback_font = ctk.CTkFont(size=16, weight="bold")
+        self.review_title_font = ctk.CTkFont(size=13, weight="bold")
+        self.review_text_font = ctk.CTkFont(size=12)
+
         # Define your possible positions & random seeds
         self.positions = ["UT", "UTG+1", "MP", "LJ", "HJ", "CO", "BTN", "SB"]
         self.stacks = range(3, 15)          # 3BB to 14BB
         self.players_left_choices = range(2, 10)  # 2 to 9 players
 
-        self.scenarios = []     # Will store a list of (hand, stack, pos, #players)
+        self.scenarios = np.empty(0, dtype=SCENARIO_DTYPE)  # One (hand, stack, pos, pls) row per question
         self.current_index = 0
         self.score = 0
+        self.correct_actions = []  # "push"/"fold" for each scenario
         self.review_data = []   # For final review of all answers
+        self._after_id = None   # Pending auto-advance to the next question
 
-        # Holds the loaded card images (e.g. "As" -> CTkImage).
-        self.card_images = {}
-        self._load_card_images()
+        # Holds the loaded card images (e.g. "As" -> CTkImage), shared by every frame.
+        self.card_images = _get_card_images()
 
         # ----- LAYOUT -----
         self.grid_columnconfigure(0, weight=1)
@@ -51,7 +112,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.title_frame,
             text="Push/Fold Training",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.title_font,
             text_color="#1B1B1B"
         )
         self.title_label.grid(row=0, column=0, padx=10, pady=8, sticky="n")
@@ -71,7 +132,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
             self,
             text="(Scenario here)",
             wraplength=600,
-            font=ctk.CTkFont(size=14),
+            font=self.text_font,
             text_color="#3A3A3A"
         )
         self.scenario_label.grid(row=2, column=0, padx=10, pady=5, sticky="n")
@@ -86,7 +147,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
             corner_radius=8,
             width=80,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.bold_font,
             command=lambda: self._answer("push")
         )
         self.push_button.pack(side="left", padx=(0,5))
@@ -97,7 +158,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
             corner_radius=8,
             width=80,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.bold_font,
             command=lambda: self._answer("fold")
         )
         self.fold_button.pack(side="left")
@@ -106,7 +167,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         self.feedback_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.bold_font
         )
         self.feedback_label.grid(row=4, column=0, padx=10, pady=5, sticky="n")
 
@@ -114,42 +175,16 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         self._start_new_session()
 
 
-    # ---------------------------------------------------
-    # 1) LOAD CARD IMAGES (adjust to your file structure)
-    # ---------------------------------------------------
-    def _load_card_images(self):
-        # We assume you have 52 images in assets/cards/ named like "ace_of_spades.png", "10_of_diamonds.png", etc.
-        rank_map = {
-            'A': 'ace', 'K': 'king', 'Q': 'queen', 'J': 'jack',
-            'T': '10', '9': '9', '8': '8', '7': '7',
-            '6': '6', '5': '5', '4': '4', '3': '3', '2': '2'
-        }
-        suit_map = {
-            's': 'spades', 'h': 'hearts', 'd': 'diamonds', 'c': 'clubs'
-        }
-
-        base_path = "assets/cards"
-        size = (80, 110)
-
-        for r, rname in rank_map.items():
-            for s, sname in suit_map.items():
-                filename = f"{rname}_of_{sname}.png"  # e.g. "ace_of_spades.png"
-                full_path = os.path.join(base_path, filename)
-                if os.path.exists(full_path):
-                    pil_img = Image.open(full_path)
-                    pil_img = pil_img.resize(size)
-                    ctk_img = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=size)
-                    short_code = f"{r}{s}"  # e.g. "As"
-                    self.card_images[short_code] = ctk_img
-                else:
-                    # If missing, skip or log a warning
-                    pass
-
     # ---------------------------
     # 2) START A NEW QUIZ SESSION
     # ---------------------------
     def _start_new_session(self):
-        self.scenarios = [self._generate_random_scenario() for _ in range(5)]
+        self.scenarios = self._generate_scenarios(5)
+        # Answer key for the whole session, so _answer only has to index it
+        self.correct_actions = [
+            "push" if hand in get_push_fold_advice(stack, pos, pls)[1] else "fold"
+            for hand, stack, pos, pls in self.scenarios.tolist()
+        ]
         self.current_index = 0
         self.score = 0
         self.review_data = []
@@ -160,26 +195,24 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         self.fold_button.configure(state="normal")
 
     # ------------------------------
-    # 3) GENERATE RANDOM SCENARIO
+    # 3) GENERATE RANDOM SCENARIOS
     # ------------------------------
-    def _generate_random_scenario(self):
-        r1 = random.choice(RANKS)
-        r2 = random.choice(RANKS)
-        suits = ["s", "o"]
-        if r1 == r2:
-            hand = f"{r1}{r2}"  # Pair
-        else:
-            s = random.choice(suits)
-            # Ensure higher rank is first
-            if RANKS.index(r1) < RANKS.index(r2):
-                hand = f"{r1}{r2}{s}"
-            else:
-                hand = f"{r2}{r1}{s}"
-
-        stack_bb = random.choice(list(self.stacks))
-        pos = random.choice(self.positions)
-        pls = random.choice(list(self.players_left_choices))
-        return (hand, stack_bb, pos, pls)
+    def _generate_scenarios(self, n):
+        """Draws n scenarios at once into a SCENARIO_DTYPE structured array."""
+        rng = np.random.default_rng()
+        ranks = np.array(RANKS)
+        i1 = rng.integers(0, len(RANKS), n)
+        i2 = rng.integers(0, len(RANKS), n)
+        # Ensure higher rank is first (lower index = higher rank)
+        high, low = ranks[np.minimum(i1, i2)], ranks[np.maximum(i1, i2)]
+        suffix = np.where(i1 == i2, "", rng.choice(["s", "o"], n))  # Pairs get no suffix
+
+        scenarios = np.empty(n, dtype=SCENARIO_DTYPE)
+        scenarios['hand'] = np.char.add(np.char.add(high, low), suffix)
+        scenarios['stack'] = rng.choice(self.stacks, n)
+        scenarios['pos'] = rng.choice(self.positions, n)
+        scenarios['pls'] = rng.choice(self.players_left_choices, n)
+        return scenarios
 
     # ---------------------------
     # 4) SHOW CURRENT SCENARIO
@@ -188,7 +221,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         if self.current_index >= len(self.scenarios):
             return
 
-        hand, stack, pos, players = self.scenarios[self.current_index]
+        hand, stack, pos, players = self.scenarios[self.current_index].tolist()
 
         # Display card images
         self._display_cards(hand)
@@ -212,25 +245,19 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         # If length=2 => pair (e.g. "TT") => pick random suits
         # If length=3 => e.g. "A2s" => same suit or "A2o" => different suits
         if len(hand_str) == 2:
-            # Pair
-            suits_avail = ['s','h','d','c']
-            s1 = random.choice(suits_avail)
-            s2 = random.choice(suits_avail)
+            # Pair => 2 different suits (one sample call, no retries)
+            s1, s2 = random.sample(SUITS, 2)
             card1_code = f"{hand_str[0]}{s1}"
             card2_code = f"{hand_str[1]}{s2}"
         else:
             rank1, rank2, typ = hand_str[0], hand_str[1], hand_str[2]
             if typ == 's':
-                chosen_suit = random.choice(['s','h','d','c'])
+                chosen_suit = random.choice(SUITS)
                 card1_code = f"{rank1}{chosen_suit}"
                 card2_code = f"{rank2}{chosen_suit}"
             else:
                 # offsuit => 2 different suits
-                suits_avail = ['s','h','d','c']
-                s1 = random.choice(suits_avail)
-                s2 = random.choice(suits_avail)
-                while s2 == s1:
-                    s2 = random.choice(suits_avail)
+                s1, s2 = random.sample(SUITS, 2)
                 card1_code = f"{rank1}{s1}"
                 card2_code = f"{rank2}{s2}"
 
@@ -240,12 +267,12 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         if img1:
             self.card1_label.configure(image=img1, text="")
         else:
-            self.card1_label.configure(text=card1_code, font=ctk.CTkFont(size=16, weight="bold"))
+            self.card1_label.configure(text=card1_code, font=self.card_fallback_font)
 
         if img2:
             self.card2_label.configure(image=img2, text="")
         else:
-            self.card2_label.configure(text=card2_code, font=ctk.CTkFont(size=16, weight="bold"))
+            self.card2_label.configure(text=card2_code, font=self.card_fallback_font)
 
     # ---------------------------------
     # 6) USER ANSWER: PUSH OR FOLD
@@ -254,9 +281,8 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         if self.current_index >= len(self.scenarios):
             return
 
-        hand, stack, pos, players = self.scenarios[self.current_index]
-        advice_str, push_range = get_push_fold_advice(stack, pos, players)
-        correct_action = "push" if hand in push_range else "fold"
+        hand, stack, pos, players = self.scenarios[self.current_index].tolist()
+        correct_action = self.correct_actions[self.current_index]
 
         if user_action == correct_action:
             self.score += 1
@@ -271,13 +297,35 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
         self.push_button.configure(state="disabled")
         self.fold_button.configure(state="disabled")
 
-        # Auto next
-        self.after(1200, self._go_next_question)
+        # Auto next, or sooner on Enter/Space/click
+        self._after_id = self.after(1200, self._go_next_question)
+        for seq in SKIP_WAIT_KEYS:
+            self.bind_all(seq, self._skip_wait)
+        self.feedback_label.bind("<Button-1>", self._skip_wait)
 
     # ---------------------------------
     # 7) NEXT QUESTION OR FINAL SCREEN
     # ---------------------------------
+    def _skip_wait(self, event=None):
+        self._go_next_question()
+
+    def _cancel_wait(self):
+        """Drops the pending auto-advance and the skip bindings, if any."""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        for seq in SKIP_WAIT_KEYS:
+            self.unbind_all(seq)
+        self.feedback_label.unbind("<Button-1>")
+
+    def destroy(self):
+        self._cancel_wait()  # Don't leave a callback or global bindings behind
+        super().destroy()
+
     def _go_next_question(self):
+        if self._after_id is None:
+            return  # Not waiting between questions (timer already fired or was skipped)
+        self._cancel_wait()
         self.current_index += 1
         if self.current_index < len(self.scenarios):
             self.feedback_label.configure(text="", text_color="black")
@@ -327,7 +375,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
             question_label = ctk.CTkLabel(
                 line_frame,
                 text=question_text,
-                font=ctk.CTkFont(size=13, weight="bold"),
+                font=self.review_title_font,
                 anchor="w",
                 justify="left",
                 text_color="#333333"
@@ -341,7 +389,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
             answer_label = ctk.CTkLabel(
                 line_frame,
                 text=answer_text,
-                font=ctk.CTkFont(size=12),
+                font=self.review_text_font,
                 anchor="w",
                 justify="left",
                 text_color="#444444"
@@ -355,7 +403,7 @@ class PushFoldTrainerFrame(ctk.CTkFrame):
             corner_radius=8,
             width=100,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.bold_font,
             command=self._start_new_session
         )
         retry_btn.grid(row=6, column=0, padx=10, pady=(0,15), sticky="n")
@@ -3,9 +3,11 @@
 ##########################################
 import streamlit as st
 import os
+import io
+import base64
 import random
-import time
-from PIL import Image
+from types import MappingProxyType
+import numpy as np
 
 ######################
 # Import from poker_logic
@@ -31,99 +33,156 @@ except Exception as e:
 POSITIONS = ["SB", "B", "CO", "HJ", "LJ", "UTG+3", "UTG+2", "UTG+1"]
 MAX_QUESTIONS = 5
 CARD_IMG_WIDTH = 170
+STACK_RANGE = range(1, 16)  # Scenario stacks, in BB
+PLAYERS_LEFT = 6  # Advice assumes this many players left
 FEEDBACK_DELAY_SECONDS = 2.0  # 2 seconds delay after user answers
+# review_data columns, one list per field (appended to together, one entry per question)
+REVIEW_FIELDS = (
+    "hand", "stack", "pos", "card1", "card2", "card1_uri", "card2_uri",
+    "user_action", "correct_action", "is_correct", "advice", "percentage", "logic_error", "tips",
+)
+
+# Minimal extra CSS, built once at import and re-sent as-is on each run
+APP_CSS = """
+<style>
+    html, body, [class*="css"] {
+        font-size: 18px;
+    }
+    .info-block {
+        background-color: rgba(49,51,63,0.1);
+    }
+    .info-label {
+        font-size: 1.1rem;
+        opacity: 0.85;
+    }
+    .info-value {
+        font-size: 2.0rem;
+        font-weight: bold;
+    }
+    .highlight-text { color: #E67E22; }
+    .card-container {
+        display: flex; flex-direction: row; justify-content: center; align-items: center;
+        gap: 5px; margin: 0; padding: 0;
+    }
+    .card-missing { color: #E74C3C; font-weight: bold; }
+</style>
+"""
 
 ######################
 # Load Card Images
 ######################
+CARD_IMAGE_DIR = "assets/cards"
+CARD_IMG_MAX_SIZE = (CARD_IMG_WIDTH * 2, CARD_IMG_WIDTH * 3)  # 2x the display width for HiDPI screens
+# Card code -> the words used in the image filenames, e.g. "ace_of_spades.png"
+CARD_RANK_NAMES = MappingProxyType({
+    'A': 'ace', 'K': 'king', 'Q': 'queen', 'J': 'jack', 'T': '10',
+    '9': '9', '8': '8', '7': '7', '6': '6', '5': '5', '4': '4', '3': '3', '2': '2'
+})
+CARD_SUIT_NAMES = MappingProxyType({'s': 'spades', 'h': 'hearts', 'd': 'diamonds', 'c': 'clubs'})
+
+@st.cache_resource(show_spinner=False)
 def load_card_images():
-    """Loads card images into session_state.card_images."""
-    if "card_images" not in st.session_state:
-        st.session_state.card_images = {}
-
-        rank_map = {
-            'A': 'ace', 'K': 'king', 'Q': 'queen', 'J': 'jack', 'T': '10',
-            '9': '9', '8': '8', '7': '7', '6': '6', '5': '5', '4': '4', '3': '3', '2': '2'
-        }
-        suit_map = {'s': 'spades', 'h': 'hearts', 'd': 'diamonds', 'c': 'clubs'}
-
-        base_path = "assets/cards"
-        if not os.path.isdir(base_path):
-            st.error(f"Error: Card image directory not found at '{base_path}'.")
-            st.stop()
-
-        loaded_count = 0
-        for r, rname in rank_map.items():
-            for s, sname in suit_map.items():
-                filename = f"{rname}_of_{sname}.png"
-                full_path = os.path.join(base_path, filename)
-                short_code = f"{r}{s}"
-                if os.path.exists(full_path):
-                    st.session_state.card_images[short_code] = full_path
-                    loaded_count += 1
-
-        if loaded_count < 52:
-            st.warning(f"Only loaded {loaded_count}/52 card images. Some cards may be missing.")
+    """
+    Encodes every card image once per server process (shared by all sessions and reruns).
+    Returns {short_code: PNG data URI}, e.g. {"As": "data:image/png;base64,..."};
+    empty if the directory is missing.
+    """
+    card_images = {}
+    if not os.path.isdir(CARD_IMAGE_DIR):
+        return card_images
+
+    from PIL import Image  # Only needed for this one-time encode, so not imported at startup
+
+    with os.scandir(CARD_IMAGE_DIR) as entries:  # One directory read instead of a stat per card
+        paths = {entry.name: entry.path for entry in entries}
+
+    for r, rname in CARD_RANK_NAMES.items():
+        for s, sname in CARD_SUIT_NAMES.items():
+            full_path = paths.get(f"{rname}_of_{sname}.png")
+            if full_path:
+                with Image.open(full_path) as img:
+                    img.thumbnail(CARD_IMG_MAX_SIZE, Image.LANCZOS)  # Source art is far larger than shown
+                    buf = io.BytesIO()
+                    img.save(buf, format="PNG", optimize=True)
+                card_images[f"{r}{s}"] = "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode()
+    return card_images
+
+def check_card_images():
+    """Stops with an error if the card directory is missing; warns if cards are missing."""
+    if not os.path.isdir(CARD_IMAGE_DIR):
+        st.error(f"Error: Card image directory not found at '{CARD_IMAGE_DIR}'.")
+        st.stop()
+    loaded_count = len(load_card_images())
+    if loaded_count < 52:
+        st.warning(f"Only loaded {loaded_count}/52 card images. Some cards may be missing.")
 
 ######################
 # Generate Card Codes
 ######################
+SUITS = "shdc"
+_OFFSUIT_SUIT_PAIRS = [(s1, s2) for s1 in SUITS for s2 in SUITS if s1 != s2]
+
+def _build_suit_templates():
+    """Maps each of the 169 canonical hands to every legal (suit1, suit2) for its two cards."""
+    templates = {}
+    for i, r1 in enumerate(RANKS):
+        templates[r1 + r1] = _OFFSUIT_SUIT_PAIRS
+        for r2 in RANKS[i + 1:]:
+            templates[f"{r1}{r2}s"] = [(s, s) for s in SUITS]
+            templates[f"{r1}{r2}o"] = _OFFSUIT_SUIT_PAIRS
+    return templates
+
+SUIT_TEMPLATES = _build_suit_templates()
+
 def generate_specific_card_codes(hand_str):
     """
     From a canonical hand notation like 'A2s' or 'TT',
     generate the specific card codes (e.g. 'As','2s').
     """
-    if len(hand_str) == 2:  # Pair
-        rank = hand_str[0]
-        suits_avail = ['s', 'h', 'd', 'c']
-        s1 = random.choice(suits_avail)
-        suits_avail.remove(s1)
-        s2 = random.choice(suits_avail)
-        card1_code = f"{rank}{s1}"
-        card2_code = f"{rank}{s2}"
-    else:
-        rank1, rank2, type = hand_str[0], hand_str[1], hand_str[2]
-        if type == 's':
-            chosen_suit = random.choice(['s', 'h', 'd', 'c'])
-            card1_code = f"{rank1}{chosen_suit}"
-            card2_code = f"{rank2}{chosen_suit}"
-        else:  # 'o'
-            suits_avail = ['s', 'h', 'd', 'c']
-            s1 = random.choice(suits_avail)
-            suits_avail.remove(s1)
-            s2 = random.choice(suits_avail)
-            if RANKS.index(rank1) < RANKS.index(rank2):
-                card1_code = f"{rank1}{s1}"
-                card2_code = f"{rank2}{s2}"
-            else:
-                card1_code = f"{rank2}{s1}"
-                card2_code = f"{rank1}{s2}"
-    return card1_code, card2_code
+    s1, s2 = random.choice(SUIT_TEMPLATES[hand_str])
+    return f"{hand_str[0]}{s1}", f"{hand_str[1]}{s2}"
 
 ######################
-# Generate a scenario
+# Generate scenarios
 ######################
-def generate_random_scenario():
+_RNG = np.random.default_rng()
+RANKS_ARR = np.array(list(RANKS))
+POSITIONS_ARR = np.array(POSITIONS)
+HAND_SUFFIXES = np.array(["s", "o"])
+
+def generate_scenarios_batch(n):
     """
-    Returns (hand, stack, pos, card1_code, card2_code).
+    Returns n scenarios, each (hand, stack, pos, card1_code, card2_code, card1_uri, card2_uri),
+    drawing every field for all n at once with numpy. The card image URIs are looked up
+    here once (None if missing), so reruns never touch the image cache.
     """
-    r1 = random.choice(RANKS)
-    r2 = random.choice(RANKS)
-    suits = ["s", "o"]
-    if r1 == r2:
-        hand = f"{r1}{r2}"
-    else:
-        s = random.choice(suits)
-        if RANKS.index(r1) < RANKS.index(r2):
-            hand = f"{r1}{r2}{s}"
-        else:
-            hand = f"{r2}{r1}{s}"
-
-    stack_bb = random.randint(1, 15)
-    pos = random.choice(POSITIONS)
+    rank_idx = np.sort(_RNG.integers(0, len(RANKS), size=(n, 2)), axis=1)  # Higher rank (lower index) first
+    suffix = np.where(rank_idx[:, 0] == rank_idx[:, 1], "", HAND_SUFFIXES[_RNG.integers(0, 2, size=n)])
+    hands = np.char.add(np.char.add(RANKS_ARR[rank_idx[:, 0]], RANKS_ARR[rank_idx[:, 1]]), suffix).tolist()
+    stacks = _RNG.integers(STACK_RANGE.start, STACK_RANGE.stop, size=n).tolist()
+    positions = POSITIONS_ARR[_RNG.integers(0, len(POSITIONS), size=n)].tolist()
+    card_images = load_card_images()
+    scenarios = []
+    for hand, stack_bb, pos in zip(hands, stacks, positions):
+        c1, c2 = generate_specific_card_codes(hand)
+        scenarios.append((hand, stack_bb, pos, c1, c2, card_images.get(c1), card_images.get(c2)))
+    return scenarios
+
+def scenario_info_html(hand, stack, pos):
+    """The 'Scenario Details' block for one scenario, built once when the quiz is generated."""
+    return f"""
+        ### Scenario Details
 
-    card1_code, card2_code = generate_specific_card_codes(hand)
-    return (hand, stack_bb, pos, card1_code, card2_code)
+        <div class="info-block stack-block">
+            <span class="info-label">Stack</span>
+            <span class="info-value">{stack} BB</span>
+        </div>
+        <div class="info-block position-block">
+            <span class="info-label">Position</span>
+            <span class="info-value">{pos}</span>
+        </div>
+        <p class='info-text hand-text'>Your Hand: <strong class='highlight-text'>{hand}</strong></p>
+        """
 
 ######################
 # Initialize
@@ -134,51 +193,51 @@ def initialize_session_state():
         _reset_quiz_state()
     elif "scenarios" not in st.session_state or not st.session_state.scenarios:
         _reset_quiz_state()
-    elif st.session_state.scenarios and len(st.session_state.scenarios[0]) != 5:
+    elif st.session_state.scenarios and len(st.session_state.scenarios[0]) != 7:
+        _reset_quiz_state()
+    elif not isinstance(st.session_state.get("review_data"), dict):
+        _reset_quiz_state()
+    elif "scenario_html" not in st.session_state:
         _reset_quiz_state()
 
 def _reset_quiz_state():
-    st.session_state.scenarios = [generate_random_scenario() for _ in range(MAX_QUESTIONS)]
+    st.session_state.scenarios = generate_scenarios_batch(MAX_QUESTIONS)
+    st.session_state.scenario_html = [scenario_info_html(*sc[:3]) for sc in st.session_state.scenarios]
     st.session_state.current_index = 0
     st.session_state.score = 0
-    st.session_state.review_data = []
+    st.session_state.review_data = {field: [] for field in REVIEW_FIELDS}
     st.session_state.show_feedback = False
     st.session_state.user_choice = None
     st.session_state.correct_action = None
     st.session_state.push_range_details = None
     st.session_state.quiz_started = True
     st.session_state.feedback_processed = False
+    st.session_state.advance_armed = False
 
 ######################
 # Display Cards
 ######################
-def display_cards(card1_code, card2_code, container):
+def display_cards(card1_code, card2_code, card1_uri, card2_uri, container):
     """
-    Displays two card images in a container.
+    Displays two card images in a container, as one HTML block (no nested columns).
+    The URIs come precomputed from the scenario; a None URI shows the code as missing.
     """
-    img1_path = st.session_state.card_images.get(card1_code)
-    img2_path = st.session_state.card_images.get(card2_code)
+    html = []
+    for code, uri in ((card1_code, card1_uri), (card2_code, card2_uri)):
+        if uri:
+            html.append(f'<img src="{uri}" width="{CARD_IMG_WIDTH}" alt="{code}"/>')
+        else:
+            html.append(f'<span class="card-missing">Missing: {code}</span>')
     with container:
-        st.markdown('<div class="card-container">', unsafe_allow_html=True)
-        c1, c2 = st.columns(2, gap="small")
-        with c1:
-            if img1_path:
-                st.image(Image.open(img1_path), width=CARD_IMG_WIDTH)
-            else:
-                st.error(f"Missing: {card1_code}")
-        with c2:
-            if img2_path:
-                st.image(Image.open(img2_path), width=CARD_IMG_WIDTH)
-            else:
-                st.error(f"Missing: {card2_code}")
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="card-container">{"".join(html)}</div>', unsafe_allow_html=True)
 
 ######################
 # Show question
 ######################
 def show_question_ui():
-    index = st.session_state.current_index
-    hand, stack, pos, c1, c2 = st.session_state.scenarios[index]
+    session = st.session_state
+    index = session.current_index
+    hand, stack, pos, c1, c2, uri1, uri2 = session.scenarios[index]
 
     st.markdown("---")
     progress = (index + 1) / MAX_QUESTIONS
@@ -187,35 +246,22 @@ def show_question_ui():
 
     col_info, col_cards, col_action = st.columns([0.35, 0.3, 0.35])
     with col_info:
-        st.markdown("### Scenario Details")
-        st.markdown(f"""
-        <div class="info-block stack-block">
-            <span class="info-label">Stack</span>
-            <span class="info-value">{stack} BB</span>
-        </div>
-        <div class="info-block position-block">
-            <span class="info-label">Position</span>
-            <span class="info-value">{pos}</span>
-        </div>
-        <p class='info-text hand-text'>Your Hand: <strong class='highlight-text'>{hand}</strong></p>
-        """, unsafe_allow_html=True)
+        st.markdown(session.scenario_html[index], unsafe_allow_html=True)
 
     with col_cards:
-        display_cards(c1, c2, col_cards)
+        display_cards(c1, c2, uri1, uri2, col_cards)
 
     with col_action:
-        st.markdown("### Your Decision")
-        st.markdown("<p class='prompt-text'>Push All-In or Fold?</p>", unsafe_allow_html=True)
+        st.markdown("### Your Decision\n<p class='prompt-text'>Push All-In or Fold?</p>", unsafe_allow_html=True)
 
+        # on_click runs before the click's own fragment rerun, which then renders the feedback
         b1, b2 = st.columns(2)
         with b1:
-            if st.button("PUSH ALL-IN 🚀", key=f"push_{index}", use_container_width=True):
-                handle_user_action("push")
-                st.rerun()
+            st.button("PUSH ALL-IN 🚀", key=f"push_{index}", use_container_width=True,
+                      on_click=handle_user_action, args=("push",))
         with b2:
-            if st.button("FOLD ✋", key=f"fold_{index}", use_container_width=True):
-                handle_user_action("fold")
-                st.rerun()
+            st.button("FOLD ✋", key=f"fold_{index}", use_container_width=True,
+                      on_click=handle_user_action, args=("fold",))
 
 ######################
 # Handle user action
@@ -224,6 +270,36 @@ def handle_user_action(user_action):
     st.session_state.user_choice = user_action
     st.session_state.show_feedback = True
 
+######################
+# Push/fold lookup table
+######################
+@st.cache_resource(show_spinner=False)
+def build_push_table():
+    """
+    Precomputes the advice for every (stack, pos) a scenario can have, shared by all sessions.
+    Returns {(stack, pos): (advice_str, push_set, percentage, tips_str)}; push_set is a
+    frozenset for O(1) membership, or None (with percentage None) on a logic error.
+    """
+    table = {}
+    for stack_bb in STACK_RANGE:
+        for pos in POSITIONS:
+            # In your poker_logic, ensure we return a 4th item: tips_str
+            # e.g.: (advice_str, push_range, percentage, tips_str)
+            try:
+                advice_str, push_range, percentage, tips_str = get_push_fold_advice(stack_bb, pos, PLAYERS_LEFT)
+                if isinstance(advice_str, str) and "Error:" in advice_str:
+                    push_range = None
+                    percentage = None
+                    # tips_str can still be shown if it was included
+            except Exception as e:
+                advice_str = f"Error: {e}"
+                push_range = None
+                percentage = None
+                tips_str = "No tips - error occurred."
+            push_set = frozenset(push_range) if push_range is not None else None
+            table[(stack_bb, pos)] = (advice_str, push_set, percentage, tips_str)
+    return table
+
 ######################
 # Show feedback
 ######################
@@ -231,27 +307,16 @@ def show_feedback_ui():
     """
     Displays only a feedback message + real tips, then auto-advances after 2s.
     """
-    idx = st.session_state.current_index
-    hand, stack, pos, c1, c2 = st.session_state.scenarios[idx]
-    user_action = st.session_state.user_choice
+    session = st.session_state  # One local instead of repeated SessionState lookups
+    hand, stack, pos, c1, c2, uri1, uri2 = session.scenarios[session.current_index]
+    user_action = session.user_choice
 
     if not logic_available:
         st.error("Poker logic not available.")
-        st.session_state.push_range_details = ("Error: Logic Unavailable", None, None, "No tips found.")
+        session.push_range_details = ("Error: Logic Unavailable", None, None, "No tips found.")
+        advice_str, push_range, percentage, tips_str = session.push_range_details
     else:
-        # In your poker_logic, ensure we return a 4th item: tips_str
-        # e.g.: (advice_str, push_range, percentage, tips_str)
-        try:
-            advice_str, push_range, percentage, tips_str = get_push_fold_advice(stack, pos, 6)  # Using default 6 players left
-            if isinstance(advice_str, str) and "Error:" in advice_str:
-                push_range = None
-                percentage = None
-                # tips_str can still be shown if it was included
-        except Exception as e:
-            advice_str = f"Error: {e}"
-            push_range = None
-            percentage = None
-            tips_str = "No tips - error occurred."
+        advice_str, push_range, percentage, tips_str = build_push_table()[(stack, pos)]
 
     # Evaluate correctness
     if push_range and hand in push_range:
@@ -263,48 +328,53 @@ def show_feedback_ui():
     if push_range is not None:
         is_correct = (user_action == correct_action)
     # Show immediate feedback
-    st.markdown("---")
-    st.markdown("## Feedback")
+    st.markdown("---\n## Feedback")
 
     if is_correct is True:
-        st.session_state.score += 1
+        session.score += 1
         st.success(f"✅ Correct! You chose {user_action.upper()}.", icon="👍")
     elif is_correct is False:
         st.error(f"❌ Incorrect. Correct: {correct_action.upper()}.", icon="👎")
     else:
         st.error(f"⚠️ {advice_str}", icon="🚨")
 
-    # If no error, show advice & tips
+    # If no error, show advice & tips (emitted together with the countdown below)
+    feedback_md = ""
     if is_correct is not None:
         disp = advice_str
         if percentage is not None:
             disp += f" (~{percentage:.1f}%)"
-        st.markdown(f"**Advice:** {disp}")
-        st.markdown(f"**Tips:** {tips_str}")
-
-    # Add to review_data
-    st.session_state.review_data.append({
-        "hand": hand,
-        "stack": stack,
-        "pos": pos,
-        "card1": c1,
-        "card2": c2,
-        "user_action": user_action,
-        "correct_action": correct_action if is_correct is not None else "Unknown",
-        "is_correct": is_correct,
-        "advice": advice_str,
-        "percentage": percentage,
-        "logic_error": (is_correct is None),
-        "tips": tips_str
-    })
-
-    st.markdown(f"<div style='text-align:center;margin-top:25px;font-size:0.9rem;opacity:0.7;'>Next question in {FEEDBACK_DELAY_SECONDS:.1f} seconds...</div>", unsafe_allow_html=True)
-    time.sleep(FEEDBACK_DELAY_SECONDS)
-
-    st.session_state.current_index += 1
-    st.session_state.show_feedback = False
-    st.session_state.user_choice = None
-    st.rerun()
+        feedback_md = f"**Advice:** {disp}  \n**Tips:** {tips_str}\n\n"
+
+    # Add to review_data (values in REVIEW_FIELDS order)
+    review_data = session.review_data
+    row = (
+        hand, stack, pos, c1, c2, uri1, uri2, user_action,
+        correct_action if is_correct is not None else "Unknown",
+        is_correct, advice_str, percentage, (is_correct is None), tips_str,
+    )
+    for field, value in zip(REVIEW_FIELDS, row):
+        review_data[field].append(value)
+
+    st.markdown(feedback_md + f"<div style='text-align:center;margin-top:25px;font-size:0.9rem;opacity:0.7;'>Next question in {FEEDBACK_DELAY_SECONDS:.1f} seconds...</div>", unsafe_allow_html=True)
+    session.advance_armed = False
+    auto_advance()
+
+@st.fragment(run_every=FEEDBACK_DELAY_SECONDS)
+def auto_advance():
+    """
+    Moves on to the next question FEEDBACK_DELAY_SECONDS after the feedback renders.
+    The first call (inside the quiz fragment run) only arms it; the timed fragment
+    rerun advances, so the server thread never sleeps. The advance is an app-wide
+    rerun since a fragment-scoped one here would only redraw this timer.
+    """
+    session = st.session_state
+    if session.advance_armed:
+        session.current_index += 1
+        session.show_feedback = False
+        session.user_choice = None
+        st.rerun()
+    session.advance_armed = True
 
 ######################
 # Final score
@@ -327,44 +397,40 @@ def show_final_score_ui():
 
     st.markdown("### Review Your Answers:")
     review_data = st.session_state.review_data
-    if not review_data:
+    if not review_data["hand"]:
         st.warning("No review data found.")
         return
 
-    for i, row in enumerate(review_data):
-        with st.container():
-            cL, cR = st.columns([0.75, 0.25])
-            with cL:
-                st.markdown(
-                    f"<p class='review-question'><strong>Q{i+1}: {row['hand']}</strong> ({row['stack']}BB, {row['pos']})</p>",
-                    unsafe_allow_html=True
-                )
-                ua = row['user_action'].upper()
-                ca = row['correct_action'].upper()
-                st.markdown(
-                    f"<p class='review-details'>Your Choice: <strong>{ua}</strong> | Correct: <strong>{ca}</strong></p>",
-                    unsafe_allow_html=True
-                )
-
-                advice_disp = row['advice']
-                if not row['logic_error'] and row['percentage'] is not None:
-                    advice_disp += f" (~{row['percentage']:.1f}%)"
-
-                if row['logic_error']:
-                    st.markdown(f"<p class='review-advice error'>⚠️ {advice_disp}</p>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"<p class='review-advice'>ℹ️ Advice: {advice_disp}</p>", unsafe_allow_html=True)
-
-                if row.get("tips"):
-                    st.markdown(f"<p style='font-size:1.1rem; color:#555;'><strong>Tip:</strong> {row['tips']}</p>", unsafe_allow_html=True)
-
-            with cR:
-                if row["logic_error"]:
-                    st.warning("Data Error", icon="⚠️")
-                elif row["is_correct"]:
-                    st.success("✅ Correct")
-                else:
-                    st.error("❌ Incorrect")
+    # One dataframe for the whole review, instead of a container + markdown per question
+    st.dataframe(
+        {
+            "Q": list(range(1, len(review_data["hand"]) + 1)),
+            "Hand": review_data["hand"],
+            "Stack (BB)": review_data["stack"],
+            "Position": review_data["pos"],
+            "Card 1": review_data["card1_uri"],
+            "Card 2": review_data["card2_uri"],
+            "Your Choice": [ua.upper() for ua in review_data["user_action"]],
+            "Correct": [ca.upper() for ca in review_data["correct_action"]],
+            "Result": [
+                "⚠️ Data Error" if err else ("✅ Correct" if ok else "❌ Incorrect")
+                for err, ok in zip(review_data["logic_error"], review_data["is_correct"])
+            ],
+            "Advice": [
+                f"{adv} (~{pct:.1f}%)" if not err and pct is not None else adv
+                for adv, pct, err in zip(review_data["advice"], review_data["percentage"], review_data["logic_error"])
+            ],
+            "Tips": review_data["tips"],
+        },
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Card 1": st.column_config.ImageColumn("Card 1", width="small"),
+            "Card 2": st.column_config.ImageColumn("Card 2", width="small"),
+            "Advice": st.column_config.TextColumn("Advice", width="large"),
+            "Tips": st.column_config.TextColumn("Tips", width="large"),
+        },
+    )
 
     st.markdown("---")
     c1, c2, c3 = st.columns([0.3, 0.4, 0.3])
@@ -373,6 +439,24 @@ def show_final_score_ui():
             st.session_state.quiz_started = False
             st.rerun()
 
+######################
+# Quiz fragment
+######################
+@st.fragment
+def quiz_fragment():
+    """
+    The question/feedback/score UI. Push/Fold clicks rerun only this fragment,
+    not the page header, CSS and setup in main().
+    """
+    session = st.session_state
+    if session.current_index < MAX_QUESTIONS:
+        if session.show_feedback:
+            show_feedback_ui()
+        else:
+            show_question_ui()
+    else:
+        show_final_score_ui()
+
 ######################
 # main
 ######################
@@ -383,30 +467,7 @@ def main():
         initial_sidebar_state="collapsed"
     )
 
-    # Minimal extra CSS
-    st.markdown("""
-    <style>
-        html, body, [class*="css"] {
-            font-size: 18px;
-        }
-        .info-block {
-            background-color: rgba(49,51,63,0.1);
-        }
-        .info-label {
-            font-size: 1.1rem;
-            opacity: 0.85;
-        }
-        .info-value {
-            font-size: 2.0rem;
-            font-weight: bold;
-        }
-        .highlight-text { color: #E67E22; }
-        .card-container {
-            display: flex; flex-direction: row; justify-content: center; align-items: center;
-            gap: 5px; margin: 0; padding: 0;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(APP_CSS, unsafe_allow_html=True)
 
     st.markdown("<h1 style='text-align: center;'>♠️ ♥️ Poker Push/Fold Trainer ♦️ ♣️</h1>", unsafe_allow_html=True)
     st.markdown("<p style='text-align: center;'>Practice short-stack tournament decisions.</p>", unsafe_allow_html=True)
@@ -415,16 +476,9 @@ def main():
         st.error("poker_logic.py unavailable.")
         st.stop()
 
-    load_card_images()
+    check_card_images()
     initialize_session_state()
-
-    if st.session_state.current_index < MAX_QUESTIONS:
-        if st.session_state.show_feedback:
-            show_feedback_ui()
-        else:
-            show_question_ui()
-    else:
-        show_final_score_ui()
+    quiz_fragment()
 
 if __name__ == "__main__":
     main()